@@ -6,10 +6,25 @@ Running this module as a script prints a random Fibonacci number for an index in
 from __future__ import annotations
 
 import random
-from functools import lru_cache
+from typing import Final
+
+# Precomputed values for small indices, also used by ``main``.
+_FIB_TABLE: Final[tuple[int, ...]] = (
+    0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55,
+    89, 144, 233, 377, 610, 987, 1597, 2584, 4181, 6765,
+)
+
+
+def _fib_pair(k: int) -> tuple[int, int]:
+    """Return ``(F(k), F(k + 1))`` using the fast-doubling identities."""
+    if k == 0:
+        return (0, 1)
+    a, b = _fib_pair(k >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    return (c, d) if k & 1 == 0 else (d, c + d)
 
 
-@lru_cache(maxsize=None)
 def fibonacci(n: int) -> int:
     """Return the *n*th Fibonacci number.
 
@@ -27,14 +42,14 @@ def fibonacci(n: int) -> int:
     """
     if n < 0:
         raise ValueError("Fibonacci numbers are only defined for non-negative integers")
-    if n in (0, 1):
-        return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    if n < len(_FIB_TABLE):
+        return _FIB_TABLE[n]
+    return _fib_pair(n)[0]
 
 
 def main() -> None:
-    index = random.randint(0, 20)
-    print(f"Fibonacci number F({index}) = {fibonacci(index)}")
+    index = random.randint(0, len(_FIB_TABLE) - 1)
+    print(f"Fibonacci number F({index}) = {_FIB_TABLE[index]}")
 
 
 if __name__ == "__main__":